@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING, Any
+
 from weni.broadcasts.broadcast import Broadcast
 from weni.broadcasts.messages import (
     Message,
@@ -16,11 +18,13 @@ from weni.broadcasts.messages import (
     WhatsAppFlows,
     WhatsAppProductGroup,
 )
-from weni.broadcasts.sender import (
-    BroadcastSender,
-    BroadcastSenderConfigError,
-    BroadcastSenderError,
-)
+
+if TYPE_CHECKING:
+    from weni.broadcasts.sender import (
+        BroadcastSender,
+        BroadcastSenderConfigError,
+        BroadcastSenderError,
+    )
 
 __all__ = [
     # Main classes
@@ -46,3 +50,16 @@ __all__ = [
     "PixPayment",
     "WhatsAppFlows",
 ]
+
+# The sender depends on `requests`, which dominates the import time of the
+# package. Load it on first access so tools that never broadcast don't pay
+# for it on cold start.
+_SENDER_EXPORTS = ("BroadcastSender", "BroadcastSenderError", "BroadcastSenderConfigError")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SENDER_EXPORTS:
+        from weni.broadcasts import sender
+
+        return getattr(sender, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
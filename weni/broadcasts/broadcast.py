@@ -5,7 +5,9 @@ This provides the foundation for sending WhatsApp messages
 during tool execution via the Flows WhatsApp Broadcasts API.
 """
 
-from typing import TYPE_CHECKING
+import logging
+from concurrent.futures import Future, wait
+from typing import TYPE_CHECKING, Any
 
 from weni.broadcasts.messages import Message
 
@@ -13,6 +15,8 @@ if TYPE_CHECKING:
     from weni.broadcasts.sender import BroadcastSender
     from weni.tool import Tool
 
+logger = logging.getLogger(__name__)
+
 # Context variable for storing pending messages per execution context.
 # This provides proper isolation between:
 # - Concurrent tool executions
@@ -44,12 +48,25 @@ class Broadcast:
                 return FinalResponse()
         ```
     """
+
+    DEFAULT_WAIT_TIMEOUT = 30.0
+
     def __init__(self, tool: "Tool"):
         self._tool = tool
 
     def _get_sender(self) -> "BroadcastSender":
-        from weni.broadcasts.sender import BroadcastSender
-        return BroadcastSender(self._tool.context)
+        """
+        Return the tool's sender, creating it on first use.
+
+        The sender is cached on the tool so every Broadcast(self) call made
+        during one execution shares its resolved configuration and HTTP session.
+        """
+        sender = self._tool._broadcast_sender
+        if sender is None:
+            from weni.broadcasts.sender import BroadcastSender
+            sender = BroadcastSender(self._tool.context)
+            self._tool._broadcast_sender = sender
+        return sender
 
     def send(self, message: Message) -> None:
         """
@@ -58,26 +75,103 @@ class Broadcast:
         If configure() hasn't been called, the message is only registered
         in BroadcastEvent for tracking (backward compatibility).
 
+        Messages still pending from send_async() are sent first, so the
+        contact receives them in the order they were made.
+
         Args:
             message: The Message object to send (Text, Attachment, etc.)
         """
-        self._tool.register_broadcast(message.format_message())
+        payload = message.format_message()
+        self._tool.register_broadcast(payload)
 
         sender = self._get_sender()
-        sender.send(message.format_message())
+        self.wait()
+        sender.send(payload)
+
+    def send_async(self, message: Message) -> "Future[dict[str, Any]]":
+        """
+        Send a broadcast message without waiting for the Flows API response.
+
+        The message is registered immediately and POSTed in the background, so
+        the tool keeps running while the request is in flight. Tool execution
+        waits for pending sends before returning its result.
+
+        Args:
+            message: The Message object to send (Text, QuickReply, etc.)
+
+        Returns:
+            A Future resolving to the Flows API response.
+        """
+        payload = message.format_message()
+        self._tool.register_broadcast(payload)
+
+        sender = self._get_sender()
+        future = sender.send_async(payload)
+        self._tool._pending_broadcast_futures.append(future)
+        return future
 
     def send_many(self, messages: list[Message]) -> None:
         """
         Send multiple broadcast messages.
 
+        Messages still pending from send_async() are sent first.
+
         Args:
             messages: List of Message objects to send.
         """
         if not messages:
             return
 
-        for message in messages:
-            self._tool.register_broadcast(message.format_message())
+        payloads = [message.format_message() for message in messages]
+        for payload in payloads:
+            self._tool.register_broadcast(payload)
 
         sender = self._get_sender()
-        sender.send_batch([msg.format_message() for msg in messages])
+        self.wait()
+        sender.send_batch(payloads)
+
+    def wait(self, timeout: float | None = DEFAULT_WAIT_TIMEOUT, raise_errors: bool = True) -> None:
+        """
+        Block until every message sent with send_async() has been sent.
+
+        Sends still queued when the timeout expires are cancelled; a POST that
+        is already in flight can't be stopped and finishes in the background.
+
+        Args:
+            timeout: Maximum number of seconds to wait. None waits indefinitely.
+            raise_errors: Raise on a failed or timed out send. When False, the
+                failure is logged instead.
+
+        Raises:
+            BroadcastSenderError: If a send failed or didn't finish in time and
+                raise_errors is True.
+        """
+        futures = self._tool._pending_broadcast_futures
+        if not futures:
+            return
+
+        from weni.broadcasts.sender import BroadcastSenderError
+
+        pending = list(futures)
+        futures.clear()
+        _, not_done = wait(pending, timeout=timeout)
+        for future in not_done:
+            future.cancel()
+
+        errors: list[BaseException] = []
+        if not_done:
+            errors.append(
+                BroadcastSenderError(f"Timed out after {timeout}s waiting for {len(not_done)} broadcast(s).")
+            )
+        for future in pending:
+            if future in not_done or future.cancelled():
+                continue
+            error = future.exception()
+            if error is not None:
+                errors.append(error)
+        if not errors:
+            return
+        if raise_errors:
+            raise errors[0]
+        for error in errors:
+            logger.warning("Broadcast was not sent: %s", error)
@@ -22,6 +22,8 @@ class Message(ABC):
     appropriate payload structure.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def format_message(self) -> dict[str, Any]:
         """
@@ -52,7 +54,7 @@ class Message(ABC):
             payload["footer"] = footer
 
 
-@dataclass
+@dataclass(slots=True)
 class Text(Message):
     """
     Simple text message.
@@ -75,7 +77,7 @@ class Text(Message):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class QuickReply(Message):
     """
     Message with quick reply buttons.
@@ -110,7 +112,7 @@ class QuickReply(Message):
         return payload
 
 
-@dataclass
+@dataclass(slots=True)
 class WebChatProduct:
     """A product with full details for Weni WebChat catalog."""
 
@@ -125,7 +127,7 @@ class WebChatProduct:
     product_url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WebChatProductGroup:
     """A group of products under a category for Weni WebChat."""
 
@@ -133,7 +135,7 @@ class WebChatProductGroup:
     product_retailer_info: list[WebChatProduct] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class WeniWebChatCatalog(Message):
     """
     Catalog message for Weni WebChat with full product details.
@@ -210,7 +212,7 @@ class WeniWebChatCatalog(Message):
         return payload
 
 
-@dataclass
+@dataclass(slots=True)
 class WhatsAppProductGroup:
     """A group of products by retailer IDs for WhatsApp catalog."""
 
@@ -218,7 +220,7 @@ class WhatsAppProductGroup:
     product_retailer_ids: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class WhatsAppCatalog(Message):
     """
     Catalog message for WhatsApp with product retailer IDs.
@@ -269,7 +271,7 @@ class WhatsAppCatalog(Message):
         return payload
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderItem:
     """A single item in a one-click payment order."""
 
@@ -280,7 +282,32 @@ class OrderItem:
     sale_amount: int | None = None
 
 
-@dataclass
+def _order_item_to_payload(item: OrderItem) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "retailer_id": item.retailer_id,
+        "name": item.name,
+        "amount": {"value": item.amount, "offset": 100},
+        "quantity": item.quantity,
+    }
+    if item.sale_amount is not None:
+        payload["sale_amount"] = {"value": item.sale_amount, "offset": 100}
+    return payload
+
+
+def _order_to_payload(
+    items: list[OrderItem], subtotal: int, tax_value: int, discount_value: int, shipping_value: int
+) -> dict[str, Any]:
+    """Build the `order` object shared by the order_details payment messages."""
+    return {
+        "items": [_order_item_to_payload(item) for item in items],
+        "subtotal": subtotal,
+        "tax": {"description": "Impostos", "offset": 100, "value": tax_value},
+        "discount": {"description": "Desconto", "offset": 100, "value": discount_value},
+        "shipping": {"description": "Frete", "offset": 100, "value": shipping_value},
+    }
+
+
+@dataclass(slots=True)
 class OneClickPayment(Message):
     """
     One-click payment message with saved card details.
@@ -319,25 +346,9 @@ class OneClickPayment(Message):
     shipping_value: int = 0
 
     def format_message(self) -> dict[str, Any]:
-        order_items = []
-        for item in self.items:
-            item_dict: dict[str, Any] = {
-                "retailer_id": item.retailer_id,
-                "name": item.name,
-                "amount": {"value": item.amount, "offset": 100},
-                "quantity": item.quantity,
-            }
-            if item.sale_amount is not None:
-                item_dict["sale_amount"] = {"value": item.sale_amount, "offset": 100}
-            order_items.append(item_dict)
-
-        order: dict[str, Any] = {
-            "items": order_items,
-            "subtotal": self.subtotal,
-            "tax": {"description": "Impostos", "offset": 100, "value": self.tax_value},
-            "discount": {"description": "Desconto", "offset": 100, "value": self.discount_value},
-            "shipping": {"description": "Frete", "offset": 100, "value": self.shipping_value},
-        }
+        order = _order_to_payload(
+            self.items, self.subtotal, self.tax_value, self.discount_value, self.shipping_value
+        )
 
         return {
             "text": self.text,
@@ -358,7 +369,7 @@ class OneClickPayment(Message):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WhatsAppFlows(Message):
     """
     WhatsApp Flows interactive message.
@@ -399,7 +410,7 @@ class WhatsAppFlows(Message):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WhatsAppCarouselQuickReply:
     """Quick reply button for a WhatsApp carousel slide (payload `parameters.id` / `parameters.title`)."""
 
@@ -408,7 +419,7 @@ class WhatsAppCarouselQuickReply:
     sub_type: str = "quick_reply"
 
 
-@dataclass
+@dataclass(slots=True)
 class WhatsAppCarouselSlide:
     """One carousel card: body copy and quick reply buttons."""
 
@@ -459,7 +470,7 @@ def _carousel_slide_from_mapping(slide: dict[str, Any]) -> WhatsAppCarouselSlide
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class WhatsAppCarousel(Message):
     """
     WhatsApp carousel message with images and per-card body + quick replies.
@@ -511,7 +522,7 @@ class WhatsAppCarousel(Message):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PixPayment(Message):
     """
     PIX payment message with order details and PIX code.
@@ -555,25 +566,9 @@ class PixPayment(Message):
         ]
 
     def format_message(self) -> dict[str, Any]:
-        order_items = []
-        for item in self.items:
-            item_dict: dict[str, Any] = {
-                "retailer_id": item.retailer_id,
-                "name": item.name,
-                "amount": {"value": item.amount, "offset": 100},
-                "quantity": item.quantity,
-            }
-            if item.sale_amount is not None:
-                item_dict["sale_amount"] = {"value": item.sale_amount, "offset": 100}
-            order_items.append(item_dict)
-
-        order: dict[str, Any] = {
-            "items": order_items,
-            "subtotal": self.subtotal,
-            "tax": {"description": "Impostos", "offset": 100, "value": self.tax_value},
-            "discount": {"description": "Desconto", "offset": 100, "value": self.discount_value},
-            "shipping": {"description": "Frete", "offset": 100, "value": self.shipping_value},
-        }
+        order = _order_to_payload(
+            self.items, self.subtotal, self.tax_value, self.discount_value, self.shipping_value
+        )
 
         payload: dict[str, Any] = {
             "text": self.text,
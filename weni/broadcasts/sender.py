@@ -5,12 +5,72 @@ Sends broadcast messages directly to the Flows WhatsApp Broadcasts API
 via HTTP POST during tool execution.
 """
 
+import json
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 import requests
 
 from weni.context import Context
+from weni.flows import get_session
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# Options keeping orjson in line with the standard library: non-str keys are
+# converted to strings, and datetimes, dataclasses and subclasses of builtin
+# types are left to json.dumps instead of being serialized by orjson.
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+    if orjson is not None
+    else 0
+)
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serialize a request body to UTF-8 JSON bytes.
+
+    Uses orjson when it is installed and falls back to the standard library
+    otherwise, or when orjson can't serialize the body (e.g. datetimes or
+    integers beyond 64 bits), so both paths accept the same bodies. The one
+    difference is that orjson writes NaN and infinity as null, where
+    json.dumps writes tokens that are not valid JSON. Bytes are returned so
+    the body is sent as-is, without another encoding pass inside requests.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+    return json.dumps(obj).encode()
+
+
+# (connect, read) timeouts in seconds for each broadcast POST.
+_TIMEOUT = (2.0, 10.0)
+
+
+# Background workers for send_async(), shared by every sender in the process.
+# Each sender chains its own sends (see BroadcastSender.send_async), so one
+# contact's messages stay in order while a stalled POST for one tool only ties
+# up a single worker instead of delaying every other tool's broadcasts.
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="weni-broadcast")
+
+
+def _copy_outcome(source: Future[Any], target: Future[Any]) -> None:
+    """Resolve target with the result or exception of the finished source future."""
+    exception = source.exception()
+    if exception is None:
+        target.set_result(source.result())
+    else:
+        target.set_exception(exception)
 
 
 class BroadcastSenderError(Exception):
@@ -35,8 +95,9 @@ class BroadcastSender:
     Configuration priority:
         1. context.project
         2. context.credentials
-        3. context.globals
-        4. Environment variables
+        3. context.contact
+        4. context.globals
+        5. Environment variables
 
     Required configuration:
         - Flows URL: `flows_url` or `FLOWS_BASE_URL` env var
@@ -58,12 +119,32 @@ class BroadcastSender:
         self.auth_token = self._get_auth_token()
         self.project_uuid = self._get_config("uuid", "PROJECT_UUID", required=False)
         self.channel_uuid = self._get_config("channel_uuid", "BROADCAST_CHANNEL_UUID", required=False)
+        self.contact_urn = self._get_contact_urn()
+        self._body_fields = self._build_body_fields()
+
+        self._session: requests.Session | None = None
+
+        # Last background send of this sender; the next one starts after it.
+        self._async_tail: Future[dict[str, Any]] | None = None
+        self._async_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        HTTP session used for all requests made by this sender.
+
+        Defaults to the process-wide session, so consecutive sends and
+        senders share keep-alive connections to Flows.
+        """
+        if self._session is None:
+            self._session = get_session()
+        return self._session
 
     def _get_config(self, key: str, env_var: str, required: bool = True) -> str | None:
         """
         Get a configuration value from context or environment.
 
-        Priority: project > credentials > globals > environment
+        Priority: project > credentials > contact > globals > environment
         """
         value = (
             self.context.project.get(key)
@@ -105,6 +186,18 @@ class BroadcastSender:
             headers["Authorization"] = f"Bearer {self.auth_token}"
         return headers
 
+    def _build_body_fields(self) -> dict[str, Any]:
+        """Build the request body fields that are the same for every message."""
+        fields: dict[str, Any] = {}
+
+        if self.contact_urn:
+            fields["urns"] = [self.contact_urn]
+
+        if self.channel_uuid:
+            fields["channel"] = self.channel_uuid
+
+        return fields
+
     def _build_request_body(self, message_payload: dict[str, Any]) -> dict[str, Any]:
         """
         Build the JSON body for the Flows WhatsApp Broadcasts API.
@@ -115,17 +208,7 @@ class BroadcastSender:
         Returns:
             The request body dict.
         """
-        contact_urn = self._get_contact_urn()
-
-        body: dict[str, Any] = {"msg": message_payload}
-
-        if contact_urn:
-            body["urns"] = [contact_urn]
-
-        if self.channel_uuid:
-            body["channel"] = self.channel_uuid
-
-        return body
+        return {"msg": message_payload, **self._body_fields}
 
     def send(self, message_payload: dict[str, Any]) -> dict[str, Any]:
         """
@@ -140,12 +223,12 @@ class BroadcastSender:
         Raises:
             BroadcastSenderError: If the request fails or returns non-2xx.
         """
-        url = self._build_url()
-        headers = self._build_headers()
-        body = self._build_request_body(message_payload)
+        return self._post(self._build_url(), self._build_headers(), _dumps(self._build_request_body(message_payload)))
 
+    def _post(self, url: str, headers: dict[str, str], data: bytes) -> dict[str, Any]:
+        """POST an already serialized request body to the Flows API."""
         try:
-            response = requests.post(url, headers=headers, json=body)
+            response = self.session.post(url, headers=headers, data=data, timeout=_TIMEOUT)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -155,17 +238,64 @@ class BroadcastSender:
         except requests.exceptions.RequestException as e:
             raise BroadcastSenderError(f"Failed to send broadcast: {e}") from e
 
+    def send_async(self, message_payload: dict[str, Any]) -> "Future[dict[str, Any]]":
+        """
+        Send a broadcast message in the background.
+
+        The request body is serialized on the calling thread, so later changes
+        to message_payload do not affect what is sent, and only the HTTP POST
+        is handed to the shared worker pool. Each send starts once this
+        sender's previous one has finished, so messages are sent in
+        submission order.
+
+        Args:
+            message_payload: The formatted message from Message.format_message().
+
+        Returns:
+            A Future resolving to the parsed JSON response from Flows, or
+            raising BroadcastSenderError if the request fails.
+        """
+        url = self._build_url()
+        headers = self._build_headers()
+        data = _dumps(self._build_request_body(message_payload))
+        future: Future[dict[str, Any]] = Future()
+
+        def start(_: object = None) -> None:
+            if future.set_running_or_notify_cancel():
+                _EXECUTOR.submit(self._post, url, headers, data).add_done_callback(
+                    lambda done: _copy_outcome(done, future)
+                )
+
+        with self._async_lock:
+            previous = self._async_tail
+            self._async_tail = future
+
+        if previous is None:
+            start()
+        else:
+            previous.add_done_callback(start)
+        return future
+
     def send_batch(self, message_payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
         Send multiple broadcast messages sequentially.
 
+        Messages are sent in order over the sender's shared session. The
+        Flows API accepts a single message per broadcast, and sequential
+        sends keep the delivery order the tool asked for.
+
         Args:
             message_payloads: List of formatted messages.
 
         Returns:
             List of JSON responses from Flows.
         """
+        # URL and headers are the same for every message, so they are built
+        # once for the whole batch.
+        url = self._build_url()
+        headers = self._build_headers()
+
         results = []
         for payload in message_payloads:
-            results.append(self.send(payload))
+            results.append(self._post(url, headers, _dumps(self._build_request_body(payload))))
         return results
@@ -2,11 +2,20 @@
 Tests for Broadcast class.
 """
 
+import subprocess
+import sys
+import threading
+from concurrent.futures import Future
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from weni.broadcasts.broadcast import Broadcast
 from weni.broadcasts.messages import Text
+from weni.broadcasts.sender import BroadcastSenderError
 from weni.context import Context
+from weni.responses import FinalResponse
+from weni.tool import Tool
 
 
 def create_context(
@@ -26,67 +35,240 @@ def create_context(
     )
 
 
+def make_tool(context: Context | None = None) -> Tool:
+    """Build a bare Tool instance with the state Broadcast relies on, without running execute()."""
+    tool = object.__new__(Tool)
+    tool._pending_broadcasts = []
+    tool._pending_broadcast_futures = []
+    tool._broadcast_sender = None
+    tool.context = context or create_context(project={"auth_token": "tk"})
+    return tool
+
+
 class TestBroadcast:
     """Tests for Broadcast instance-based API."""
 
     def test_broadcast_requires_tool(self):
         """Test that Broadcast takes a tool instance."""
-        mock_tool = MagicMock()
-        mock_tool.context = create_context()
-        mock_tool._pending_broadcasts = []
+        tool = make_tool()
 
-        broadcast = Broadcast(mock_tool)
-        assert broadcast._tool is mock_tool
+        broadcast = Broadcast(tool)
+        assert broadcast._tool is tool
 
-    @patch("weni.broadcasts.sender.BroadcastSender")
-    def test_send_registers_and_sends(self, mock_sender_class):
+    def test_send_registers_and_sends(self):
         """Test that send registers the message on the tool and sends via HTTP."""
         mock_sender = MagicMock()
         mock_sender.send.return_value = {"id": 1}
-        mock_sender_class.return_value = mock_sender
-
-        mock_tool = MagicMock()
-        mock_tool.context = create_context(project={"auth_token": "tk"})
-        mock_tool._pending_broadcasts = []
+        tool = make_tool()
 
         with patch.object(Broadcast, '_get_sender', return_value=mock_sender):
-            broadcast = Broadcast(mock_tool)
+            broadcast = Broadcast(tool)
             broadcast.send(Text(text="Hello!"))
 
-        mock_tool.register_broadcast.assert_called_once_with({"text": "Hello!"})
+        assert tool._pending_broadcasts == [{"text": "Hello!"}]
         mock_sender.send.assert_called_once_with({"text": "Hello!"})
 
-    @patch("weni.broadcasts.sender.BroadcastSender")
-    def test_send_many_registers_all_and_sends_batch(self, mock_sender_class):
-        """Test that send_many registers all messages and sends as batch."""
+    def test_send_formats_message_once(self):
+        """Test that send registers and sends the same payload object."""
         mock_sender = MagicMock()
-        mock_sender_class.return_value = mock_sender
+        tool = make_tool()
 
-        mock_tool = MagicMock()
-        mock_tool.context = create_context(project={"auth_token": "tk"})
-        mock_tool._pending_broadcasts = []
+        with patch.object(Broadcast, '_get_sender', return_value=mock_sender):
+            Broadcast(tool).send(Text(text="Hello!"))
+
+        assert mock_sender.send.call_args[0][0] is tool._pending_broadcasts[0]
+
+    def test_send_many_registers_all_and_sends_batch(self):
+        """Test that send_many registers all messages and sends as batch."""
+        mock_sender = MagicMock()
+        tool = make_tool()
 
         with patch.object(Broadcast, '_get_sender', return_value=mock_sender):
-            broadcast = Broadcast(mock_tool)
+            broadcast = Broadcast(tool)
             broadcast.send_many([Text(text="Msg 1"), Text(text="Msg 2")])
 
-        assert mock_tool.register_broadcast.call_count == 2
+        assert tool._pending_broadcasts == [{"text": "Msg 1"}, {"text": "Msg 2"}]
         mock_sender.send_batch.assert_called_once()
         payloads = mock_sender.send_batch.call_args[0][0]
         assert len(payloads) == 2
         assert payloads[0]["text"] == "Msg 1"
         assert payloads[1]["text"] == "Msg 2"
 
+    def test_send_many_formats_each_message_once(self):
+        """Test that send_many registers and sends the same payload objects."""
+        mock_sender = MagicMock()
+        tool = make_tool()
+
+        with patch.object(Broadcast, '_get_sender', return_value=mock_sender):
+            Broadcast(tool).send_many([Text(text="Msg 1"), Text(text="Msg 2")])
+
+        sent = mock_sender.send_batch.call_args[0][0]
+        assert all(r is s for r, s in zip(tool._pending_broadcasts, sent, strict=True))
+
     def test_send_many_empty_does_nothing(self):
         """Test that send_many with empty list does nothing."""
-        mock_tool = MagicMock()
-        mock_tool.context = create_context()
-        mock_tool._pending_broadcasts = []
+        tool = make_tool()
+
+        with patch.object(Broadcast, '_get_sender') as mock_get_sender:
+            Broadcast(tool).send_many([])
+
+        assert tool._pending_broadcasts == []
+        mock_get_sender.assert_not_called()
+
+
+def _done_future(result=None, exception=None) -> Future:
+    future: Future = Future()
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+    return future
+
+
+class TestBroadcastAsync:
+    """Tests for send_async() and wait()."""
+
+    def test_send_async_registers_and_tracks_future(self):
+        """Test that send_async registers the payload and records the future."""
+        future = _done_future({"id": 1})
+        mock_sender = MagicMock()
+        mock_sender.send_async.return_value = future
+        tool = make_tool()
+
+        with patch.object(Broadcast, '_get_sender', return_value=mock_sender):
+            result = Broadcast(tool).send_async(Text(text="Hello!"))
+
+        assert result is future
+        assert tool._pending_broadcasts == [{"text": "Hello!"}]
+        assert tool._pending_broadcast_futures == [future]
+        mock_sender.send_async.assert_called_once_with({"text": "Hello!"})
+
+    def test_wait_clears_completed_futures(self):
+        """Test that wait drains successfully completed sends."""
+        tool = make_tool()
+        tool._pending_broadcast_futures.extend([_done_future({"id": 1}), _done_future({"id": 2})])
+
+        Broadcast(tool).wait()
+
+        assert tool._pending_broadcast_futures == []
+
+    def test_wait_reraises_send_error(self):
+        """Test that a failed background send surfaces from wait."""
+        tool = make_tool()
+        tool._pending_broadcast_futures.append(_done_future(exception=BroadcastSenderError("boom")))
+
+        with pytest.raises(BroadcastSenderError, match="boom"):
+            Broadcast(tool).wait()
+
+    def test_wait_times_out(self):
+        """Test that wait gives up after the timeout and cancels queued sends."""
+        queued: Future = Future()
+        tool = make_tool()
+        tool._pending_broadcast_futures.append(queued)
+
+        with pytest.raises(BroadcastSenderError, match="Timed out"):
+            Broadcast(tool).wait(timeout=0.01)
+
+        assert queued.cancelled()
+        assert tool._pending_broadcast_futures == []
+
+    def test_wait_logs_errors_when_not_raising(self, caplog):
+        """Test that raise_errors=False logs failed sends instead of raising."""
+        tool = make_tool()
+        tool._pending_broadcast_futures.append(_done_future(exception=BroadcastSenderError("boom")))
 
-        broadcast = Broadcast(mock_tool)
-        broadcast.send_many([])
+        Broadcast(tool).wait(raise_errors=False)
 
-        mock_tool.register_broadcast.assert_not_called()
+        assert "boom" in caplog.text
+        assert tool._pending_broadcast_futures == []
+
+    def test_wait_without_pending_sends(self):
+        """Test that wait is a no-op when nothing was sent asynchronously."""
+        Broadcast(make_tool()).wait()
+
+    @pytest.mark.parametrize("method, sender_method, message", [
+        ("send", "send", Text(text="Sync")),
+        ("send_many", "send_batch", [Text(text="Sync")]),
+    ])
+    def test_sync_send_waits_for_pending_async_sends(self, method, sender_method, message):
+        """Test that send/send_many only POST after earlier send_async calls finished."""
+        pending: Future = Future()
+        async_done_at_post = []
+        mock_sender = MagicMock()
+        mock_sender.send_async.return_value = pending
+        getattr(mock_sender, sender_method).side_effect = lambda _: async_done_at_post.append(pending.done())
+        tool = make_tool()
+
+        with patch.object(Broadcast, '_get_sender', return_value=mock_sender):
+            Broadcast(tool).send_async(Text(text="Async"))
+            threading.Timer(0.05, pending.set_result, args=({"id": 1},)).start()
+            getattr(Broadcast(tool), method)(message)
+
+        assert async_done_at_post == [True]
+        assert tool._pending_broadcast_futures == []
+
+    @patch("weni.broadcasts.sender.BroadcastSender")
+    def test_tool_waits_for_pending_sends(self, mock_sender_class):
+        """Test that tool execution waits for send_async before returning."""
+        pending: Future = Future()
+        mock_sender_class.return_value.send_async.return_value = pending
+
+        class AsyncTool(Tool):
+            def execute(self, context):
+                Broadcast(self).send_async(Text(text="Hello!"))
+                threading.Timer(0.05, pending.set_result, args=({"id": 1},)).start()
+                return FinalResponse()
+
+        result, _, _, _ = AsyncTool(create_context(project={"auth_token": "tk"}))
+
+        assert pending.done()
+        assert result["messages_sent"] == [{"text": "Hello!"}]
+
+    @patch("weni.broadcasts.sender.BroadcastSender")
+    def test_failed_background_send_does_not_fail_tool(self, mock_sender_class, caplog):
+        """Test that a failed send_async is logged and the tool result is still returned."""
+        mock_sender_class.return_value.send_async.return_value = _done_future(
+            exception=BroadcastSenderError("boom")
+        )
+
+        class AsyncTool(Tool):
+            def execute(self, context):
+                Broadcast(self).send_async(Text(text="Hello!"))
+                return FinalResponse()
+
+        result, _, _, _ = AsyncTool(create_context(project={"auth_token": "tk"}))
+
+        assert result["messages_sent"] == [{"text": "Hello!"}]
+        assert "boom" in caplog.text
+
+
+class TestBroadcastSenderCache:
+    """Tests that the sender is built once per tool execution."""
+
+    @patch("weni.broadcasts.sender.BroadcastSender")
+    def test_sender_reused_across_broadcasts(self, mock_sender_class):
+        """Test that consecutive Broadcast(tool) calls share one sender."""
+        tool = make_tool()
+
+        Broadcast(tool).send(Text(text="Msg 1"))
+        Broadcast(tool).send(Text(text="Msg 2"))
+
+        mock_sender_class.assert_called_once_with(tool.context)
+        assert mock_sender_class.return_value.send.call_count == 2
+
+    @patch("weni.broadcasts.sender.BroadcastSender")
+    def test_separate_tools_get_separate_senders(self, mock_sender_class):
+        """Test that the cached sender is not shared between tools."""
+        mock_sender_class.side_effect = lambda context: MagicMock()
+
+        tool1 = make_tool()
+        tool2 = make_tool()
+
+        Broadcast(tool1).send(Text(text="From tool 1"))
+        Broadcast(tool2).send(Text(text="From tool 2"))
+
+        assert mock_sender_class.call_count == 2
+        assert tool1._broadcast_sender is not tool2._broadcast_sender
 
 
 class TestBroadcastIsolation:
@@ -94,8 +276,6 @@ class TestBroadcastIsolation:
 
     def test_register_broadcast_appends(self):
         """Test that register_broadcast appends to the tool's list."""
-        from weni.tool import Tool
-
         mock_instance = object.__new__(Tool)
         mock_instance._pending_broadcasts = []
 
@@ -108,8 +288,6 @@ class TestBroadcastIsolation:
 
     def test_separate_tools_have_separate_broadcasts(self):
         """Test that two tool instances don't share broadcasts."""
-        from weni.tool import Tool
-
         tool1 = object.__new__(Tool)
         tool1._pending_broadcasts = []
 
@@ -123,3 +301,31 @@ class TestBroadcastIsolation:
         assert tool1._pending_broadcasts[0]["text"] == "From tool 1"
         assert len(tool2._pending_broadcasts) == 1
         assert tool2._pending_broadcasts[0]["text"] == "From tool 2"
+
+
+class TestLazySenderImport:
+    """Tests that the HTTP sender is only imported when used."""
+
+    def test_import_weni_does_not_load_requests(self):
+        """Test that importing the toolkit doesn't import requests."""
+        code = "import sys, weni; sys.exit('requests' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], check=False)
+
+        assert result.returncode == 0
+
+    def test_sender_exports_resolve_on_access(self):
+        """Test that sender names are still importable from the package."""
+        from weni import broadcasts
+        from weni.broadcasts.sender import BroadcastSender, BroadcastSenderConfigError, BroadcastSenderError
+
+        assert broadcasts.BroadcastSender is BroadcastSender
+        assert broadcasts.BroadcastSenderError is BroadcastSenderError
+        assert broadcasts.BroadcastSenderConfigError is BroadcastSenderConfigError
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown names still raise AttributeError."""
+        from weni import broadcasts
+
+        name = "DoesNotExist"
+        with pytest.raises(AttributeError):
+            getattr(broadcasts, name)
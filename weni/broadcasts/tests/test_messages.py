@@ -2,6 +2,8 @@
 Tests for broadcast message types.
 """
 
+import pytest
+
 from weni.broadcasts.messages import (
     Text,
     QuickReply,
@@ -108,6 +110,7 @@ class TestWeniWebChatCatalog:
                             description="A melhor camisa",
                             image="https://example.com/img.png",
                             sale_price="329.00",
+                            product_url="https://example.com/camisa",
                         ),
                     ],
                 ),
@@ -123,6 +126,8 @@ class TestWeniWebChatCatalog:
         assert item["description"] == "A melhor camisa"
         assert item["image"] == "https://example.com/img.png"
         assert item["sale_price"] == "329.00"
+        assert item["product_url"] == "https://example.com/camisa"
+        assert list(item)[-4:] == ["description", "image", "sale_price", "product_url"]
 
 
 class TestWhatsAppCatalog:
@@ -465,3 +470,13 @@ class TestPixPayment:
         assert len(items) == 2
         assert items[0]["quantity"] == 1
         assert items[1]["quantity"] == 2
+
+
+class TestSlots:
+    @pytest.mark.parametrize("instance", [
+        Text(text="Hello, world!"),
+        OrderItem(retailer_id="SKU-1", name="Shirt", amount=15000),
+    ], ids=lambda instance: type(instance).__name__)
+    def test_uses_slots(self, instance):
+        """Test that message instances don't carry a per-instance __dict__."""
+        assert not hasattr(instance, "__dict__")
@@ -2,16 +2,21 @@
 Tests for BroadcastSender class (HTTP-based).
 """
 
-import os
-from unittest.mock import MagicMock, patch
+import datetime
+import json
+import threading
 
 import pytest
+import requests
 
+from weni.broadcasts import sender as sender_module
 from weni.broadcasts.sender import (
     BroadcastSender,
     BroadcastSenderError,
+    _dumps,
 )
 from weni.context import Context
+from weni.flows import client as flows_client
 
 
 def create_context(
@@ -38,6 +43,66 @@ def _default_project(**overrides) -> dict:
     return base
 
 
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, json_value: object = None, status_code: int = 201, text: str = ""):
+        self.status_code = status_code
+        self.text = text
+        self._json_value = json_value
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(response=self)  # type: ignore[arg-type]
+
+    def json(self) -> object:
+        return self._json_value
+
+
+class FakeSession:
+    """
+    Records POSTs and replays the given outcomes in order.
+
+    An outcome is either a FakeResponse to return or an exception to raise;
+    the last outcome is repeated once the others are used up.
+    """
+
+    def __init__(self, *outcomes: FakeResponse | Exception):
+        self.calls: list[tuple[str, dict]] = []
+        self._outcomes = list(outcomes) or [FakeResponse({"id": 1})]
+
+    def post(self, url: str, **kwargs) -> FakeResponse:
+        self.calls.append((url, kwargs))
+        outcome = self._outcomes.pop(0) if len(self._outcomes) > 1 else self._outcomes[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    @property
+    def bodies(self) -> list[dict]:
+        return [json.loads(kwargs["data"]) for _, kwargs in self.calls]
+
+
+class BlockingSession(FakeSession):
+    """FakeSession whose POSTs wait until the gate is set."""
+
+    def __init__(self, gate: threading.Event, *outcomes: FakeResponse | Exception):
+        super().__init__(*outcomes)
+        self._gate = gate
+
+    def post(self, url: str, **kwargs) -> FakeResponse:
+        self._gate.wait(timeout=5)
+        return super().post(url, **kwargs)
+
+
+def create_sender(session: FakeSession, **context_kwargs) -> BroadcastSender:
+    """Build a sender for a default project that POSTs through the given fake session."""
+    context_kwargs.setdefault("project", _default_project())
+    sender = BroadcastSender(create_context(**context_kwargs))
+    sender._session = session  # type: ignore[assignment]
+    return sender
+
+
 class TestBroadcastSenderInit:
     def test_init_with_project_config(self):
         context = create_context(project=_default_project(uuid="proj-123", channel_uuid="ch-456"))
@@ -48,40 +113,34 @@ class TestBroadcastSenderInit:
         assert sender.project_uuid == "proj-123"
         assert sender.channel_uuid == "ch-456"
 
-    def test_init_with_credentials(self):
-        context = create_context(credentials={"flows_url": "https://flows.creds.ai"}, project={"auth_token": "tk"})
-        sender = BroadcastSender(context)
-
-        assert sender.flows_url == "https://flows.creds.ai"
-
-    def test_init_with_globals(self):
-        context = create_context(globals={"flows_url": "https://flows.globals.ai"}, project={"auth_token": "tk"})
+    @pytest.mark.parametrize(
+        "project, credentials, globals, expected",
+        [
+            ({"auth_token": "tk"}, {"flows_url": "https://flows.creds.ai"}, None, "https://flows.creds.ai"),
+            ({"auth_token": "tk"}, None, {"flows_url": "https://flows.globals.ai"}, "https://flows.globals.ai"),
+            (
+                {"flows_url": "https://flows.project", "auth_token": "tk"},
+                {"flows_url": "https://flows.creds"},
+                None,
+                "https://flows.project",
+            ),
+            ({"auth_token": "tk"}, None, None, "https://flows.stg.cloud.weni.ai"),
+        ],
+        ids=["credentials", "globals", "project_overrides_credentials", "default"],
+    )
+    def test_init_flows_url_source(self, project, credentials, globals, expected):
+        context = create_context(project=project, credentials=credentials, globals=globals)
         sender = BroadcastSender(context)
 
-        assert sender.flows_url == "https://flows.globals.ai"
+        assert sender.flows_url == expected
 
-    @patch.dict(os.environ, {"FLOWS_BASE_URL": "https://flows.env.ai"})
-    def test_init_with_env_var(self):
+    def test_init_with_env_var(self, monkeypatch):
+        monkeypatch.setenv("FLOWS_BASE_URL", "https://flows.env.ai")
         context = create_context(project={"auth_token": "tk"})
         sender = BroadcastSender(context)
 
         assert sender.flows_url == "https://flows.env.ai"
 
-    def test_init_project_overrides_credentials(self):
-        context = create_context(
-            project={"flows_url": "https://flows.project", "auth_token": "tk"},
-            credentials={"flows_url": "https://flows.creds"},
-        )
-        sender = BroadcastSender(context)
-
-        assert sender.flows_url == "https://flows.project"
-
-    def test_init_falls_back_to_default_flows_url(self):
-        context = create_context(project={"auth_token": "tk"})
-        sender = BroadcastSender(context)
-
-        assert sender.flows_url == "https://flows.stg.cloud.weni.ai"
-
     def test_init_auth_token_optional(self):
         context = create_context(project={"flows_url": "https://flows.weni.ai"})
         sender = BroadcastSender(context)
@@ -96,42 +155,38 @@ class TestBroadcastSenderInit:
 
 
 class TestBroadcastSenderContactUrn:
-    def test_from_urns_list(self):
-        context = create_context(
-            project=_default_project(),
-            contact={"urns": ["whatsapp:5511999999999", "tel:+5511999999999"]},
-        )
-        sender = BroadcastSender(context)
-        assert sender._get_contact_urn() == "whatsapp:5511999999999"
-
-    def test_from_urn_field(self):
-        context = create_context(project=_default_project(), contact={"urn": "whatsapp:5511999999999"})
-        sender = BroadcastSender(context)
-        assert sender._get_contact_urn() == "whatsapp:5511999999999"
-
-    def test_from_parameters_fallback(self):
-        context = create_context(project=_default_project(), parameters={"contact_urn": "whatsapp:5584988242399"})
-        sender = BroadcastSender(context)
-        assert sender._get_contact_urn() == "whatsapp:5584988242399"
-
-    def test_contact_takes_priority_over_parameters(self):
-        context = create_context(
-            project=_default_project(),
-            contact={"urns": ["whatsapp:5511999999999"]},
-            parameters={"contact_urn": "whatsapp:5584988242399"},
-        )
-        sender = BroadcastSender(context)
-        assert sender._get_contact_urn() == "whatsapp:5511999999999"
-
-    def test_empty_urns_list(self):
-        context = create_context(project=_default_project(), contact={"urns": []})
+    @pytest.mark.parametrize(
+        "contact, parameters, expected",
+        [
+            ({"urns": ["whatsapp:5511999999999", "tel:+5511999999999"]}, None, "whatsapp:5511999999999"),
+            ({"urn": "whatsapp:5511999999999"}, None, "whatsapp:5511999999999"),
+            (None, {"contact_urn": "whatsapp:5584988242399"}, "whatsapp:5584988242399"),
+            (
+                {"urns": ["whatsapp:5511999999999"]},
+                {"contact_urn": "whatsapp:5584988242399"},
+                "whatsapp:5511999999999",
+            ),
+            ({"urns": []}, None, None),
+            (None, None, None),
+        ],
+        ids=[
+            "urns_list",
+            "urn_field",
+            "parameters_fallback",
+            "contact_over_parameters",
+            "empty_urns_list",
+            "no_contact_no_parameters",
+        ],
+    )
+    def test_get_contact_urn(self, contact, parameters, expected):
+        context = create_context(project=_default_project(), contact=contact, parameters=parameters)
         sender = BroadcastSender(context)
-        assert sender._get_contact_urn() is None
+        assert sender._get_contact_urn() == expected
 
-    def test_no_contact_no_parameters(self):
-        context = create_context(project=_default_project())
+    def test_resolved_once_at_init(self):
+        context = create_context(project=_default_project(), contact={"urns": ["whatsapp:5511999999999"]})
         sender = BroadcastSender(context)
-        assert sender._get_contact_urn() is None
+        assert sender.contact_urn == "whatsapp:5511999999999"
 
 
 class TestBroadcastSenderBuildRequestBody:
@@ -199,50 +254,39 @@ class TestBroadcastSenderHeaders:
 
 
 class TestBroadcastSenderSend:
-    @patch("weni.broadcasts.sender.requests.post")
-    def test_send_success(self, mock_post):
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"id": 5104}
-        mock_response.raise_for_status.return_value = None
-        mock_post.return_value = mock_response
-
-        context = create_context(
+    def test_send_success(self):
+        session = FakeSession(FakeResponse({"id": 5104}))
+        sender = create_sender(
+            session,
             project=_default_project(channel_uuid="ch-123"),
             contact={"urns": ["whatsapp:5511999999999"]},
         )
-        sender = BroadcastSender(context)
         result = sender.send({"text": "Hello!"})
 
         assert result == {"id": 5104}
-        mock_post.assert_called_once_with(
-            "https://flows.weni.ai/api/v2/whatsapp_broadcasts.json",
-            headers={"Content-Type": "application/json", "Authorization": "Bearer test-token"},
-            json={"msg": {"text": "Hello!"}, "urns": ["whatsapp:5511999999999"], "channel": "ch-123"},
-        )
-
-    @patch("weni.broadcasts.sender.requests.post")
-    def test_send_http_error(self, mock_post):
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.text = '{"detail": "Invalid URN"}'
-        mock_response.raise_for_status.side_effect = __import__("requests").exceptions.HTTPError(response=mock_response)
-        mock_post.return_value = mock_response
-
-        context = create_context(project=_default_project())
-        sender = BroadcastSender(context)
+        [(url, kwargs)] = session.calls
+        assert url == "https://flows.weni.ai/api/v2/whatsapp_broadcasts.json"
+        assert kwargs["headers"] == {"Content-Type": "application/json", "Authorization": "Bearer test-token"}
+        assert kwargs["timeout"] == (2.0, 10.0)
+        assert session.bodies == [
+            {
+                "msg": {"text": "Hello!"},
+                "urns": ["whatsapp:5511999999999"],
+                "channel": "ch-123",
+            }
+        ]
+
+    def test_send_http_error(self):
+        session = FakeSession(FakeResponse(status_code=400, text='{"detail": "Invalid URN"}'))
+        sender = create_sender(session)
 
         with pytest.raises(BroadcastSenderError) as exc_info:
             sender.send({"text": "Hello"})
 
         assert "400" in str(exc_info.value)
 
-    @patch("weni.broadcasts.sender.requests.post")
-    def test_send_connection_error(self, mock_post):
-        mock_post.side_effect = __import__("requests").exceptions.ConnectionError("Connection refused")
-
-        context = create_context(project=_default_project())
-        sender = BroadcastSender(context)
+    def test_send_connection_error(self):
+        sender = create_sender(FakeSession(requests.exceptions.ConnectionError("Connection refused")))
 
         with pytest.raises(BroadcastSenderError) as exc_info:
             sender.send({"text": "Hello"})
@@ -250,27 +294,149 @@ class TestBroadcastSenderSend:
         assert "Failed to send broadcast" in str(exc_info.value)
 
 
+class TestDumps:
+    def test_returns_utf8_json_bytes(self):
+        body = {"msg": {"text": "Olá, confirmação"}}
+        data = _dumps(body)
+
+        assert isinstance(data, bytes)
+        assert json.loads(data.decode("utf-8")) == body
+
+    def test_falls_back_to_stdlib_json(self, monkeypatch):
+        monkeypatch.setattr(sender_module, "orjson", None)
+
+        assert json.loads(_dumps({"text": "Hello"})) == {"text": "Hello"}
+
+    @pytest.mark.parametrize("body", [{1: "a", None: "b", 1.5: "c"}, {"big": 2**70}])
+    def test_orjson_matches_stdlib_json(self, body):
+        pytest.importorskip("orjson")
+
+        assert json.loads(_dumps(body)) == json.loads(json.dumps(body))
+
+    def test_orjson_rejects_what_stdlib_rejects(self):
+        pytest.importorskip("orjson")
+
+        with pytest.raises(TypeError):
+            _dumps({"sent_at": datetime.datetime(2024, 1, 1)})
+
+    def test_orjson_writes_nan_as_null(self):
+        pytest.importorskip("orjson")
+
+        assert json.loads(_dumps({"value": float("nan")})) == {"value": None}
+
+
 class TestBroadcastSenderSendBatch:
-    @patch("weni.broadcasts.sender.requests.post")
-    def test_send_batch(self, mock_post):
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"id": 1}
-        mock_response.raise_for_status.return_value = None
-        mock_post.return_value = mock_response
+    @pytest.mark.parametrize("size", [0, 1, 2, 10, 25])
+    def test_send_batch_sizes(self, size):
+        session = FakeSession(FakeResponse({"id": 1}))
+        sender = create_sender(session, contact={"urns": ["whatsapp:5511999999999"]})
+        results = sender.send_batch([{"text": f"Msg {i}"} for i in range(size)])
 
-        context = create_context(project=_default_project(), contact={"urns": ["whatsapp:5511999999999"]})
-        sender = BroadcastSender(context)
-        results = sender.send_batch([{"text": "Msg 1"}, {"text": "Msg 2"}])
+        assert results == [{"id": 1}] * size
+        assert [body["msg"]["text"] for body in session.bodies] == [f"Msg {i}" for i in range(size)]
 
-        assert len(results) == 2
-        assert mock_post.call_count == 2
+    def test_send_batch_stops_at_first_error(self):
+        session = FakeSession(FakeResponse({"id": 1}), requests.exceptions.ConnectionError("Connection refused"))
+        sender = create_sender(session)
 
-    @patch("weni.broadcasts.sender.requests.post")
-    def test_send_batch_empty(self, mock_post):
-        context = create_context(project=_default_project())
-        sender = BroadcastSender(context)
-        results = sender.send_batch([])
+        with pytest.raises(BroadcastSenderError):
+            sender.send_batch([{"text": "Msg 1"}, {"text": "Msg 2"}, {"text": "Msg 3"}])
+
+        assert len(session.calls) == 2
+
+    def test_send_batch_shares_base_body(self):
+        session = FakeSession()
+        sender = create_sender(
+            session,
+            project=_default_project(channel_uuid="channel-123"),
+            contact={"urns": ["whatsapp:5511999999999"]},
+        )
+        sender.send_batch([{"text": "Msg 1"}, {"text": "Msg 2"}])
+
+        assert session.bodies == [
+            {"msg": {"text": "Msg 1"}, "urns": ["whatsapp:5511999999999"], "channel": "channel-123"},
+            {"msg": {"text": "Msg 2"}, "urns": ["whatsapp:5511999999999"], "channel": "channel-123"},
+        ]
+
+
+class TestBroadcastSenderSession:
+    def test_session_created_lazily(self, monkeypatch):
+        monkeypatch.setattr(flows_client, "_SESSION", None)
+
+        sender = BroadcastSender(create_context(project=_default_project()))
+
+        assert flows_client._SESSION is None
+        assert isinstance(sender.session, requests.Session)
+        assert flows_client._SESSION is sender.session
+
+    def test_session_shared_across_senders(self, monkeypatch):
+        monkeypatch.setattr(flows_client, "_SESSION", None)
+
+        first = BroadcastSender(create_context(project=_default_project()))
+        second = BroadcastSender(create_context(project=_default_project(flows_url="https://other.weni.ai")))
+
+        assert first.session is second.session
+
+    def test_session_pool_fits_background_workers(self, monkeypatch):
+        monkeypatch.setattr(flows_client, "_SESSION", None)
+
+        adapter = BroadcastSender(create_context(project=_default_project())).session.get_adapter("https://flows.weni.ai")
+
+        assert adapter._pool_maxsize > sender_module._EXECUTOR._max_workers
+
+    def test_session_shared_with_flows_client(self, monkeypatch):
+        monkeypatch.setattr(flows_client, "_SESSION", None)
+
+        sender = BroadcastSender(create_context(project=_default_project()))
+
+        assert sender.session is flows_client.get_session()
+
+
+class TestBroadcastSenderSendAsync:
+    def test_send_async_returns_future_with_response(self):
+        session = FakeSession(FakeResponse({"id": 7}))
+        sender = create_sender(session)
+        future = sender.send_async({"text": "Hello"})
+
+        assert future.result(timeout=5) == {"id": 7}
+        assert len(session.calls) == 1
+
+    def test_send_async_preserves_order(self):
+        session = FakeSession()
+        sender = create_sender(session)
+        futures = [sender.send_async({"text": f"Msg {i}"}) for i in range(5)]
+        for future in futures:
+            future.result(timeout=5)
+
+        assert [body["msg"]["text"] for body in session.bodies] == [f"Msg {i}" for i in range(5)]
+
+    def test_send_async_error_is_set_on_future(self):
+        sender = create_sender(FakeSession(requests.exceptions.ConnectionError("Connection refused")))
+        future = sender.send_async({"text": "Hello"})
+
+        with pytest.raises(BroadcastSenderError):
+            future.result(timeout=5)
+
+    def test_send_async_serializes_on_calling_thread(self):
+        gate = threading.Event()
+        session = BlockingSession(gate)
+        sender = create_sender(session)
+        payload = {"text": "Original"}
+        future = sender.send_async(payload)
+        payload["text"] = "Changed"
+        gate.set()
+        future.result(timeout=5)
+
+        assert session.bodies[0]["msg"]["text"] == "Original"
 
-        assert results == []
-        mock_post.assert_not_called()
+    def test_stalled_sender_does_not_block_other_senders(self):
+        gate = threading.Event()
+        stalled = create_sender(BlockingSession(gate))
+        stalled_future = stalled.send_async({"text": "Slow"})
+        try:
+            other = create_sender(FakeSession(FakeResponse({"id": 2})))
+            assert other.send_async({"text": "Fast"}).result(timeout=1) == {"id": 2}
+            assert not stalled_future.done()
+        finally:
+            gate.set()
+        stalled_future.result(timeout=5)
@@ -17,6 +17,8 @@ class Context:
         constants (Mapping): Immutable mapping for constant values
     """
 
+    __slots__ = ("constants", "contact", "credentials", "globals", "parameters", "project")
+
     credentials: Mapping
     parameters: Mapping
     globals: Mapping
@@ -15,6 +15,8 @@ class PreProcessorContext:
         credentials (Mapping): Immutable mapping for credentials data
     """
 
+    __slots__ = ("credentials", "params", "payload", "project")
+
     params: Mapping
     payload: Mapping
     credentials: Mapping
@@ -1,4 +1,7 @@
 from types import MappingProxyType
+
+import pytest
+
 from weni.context import Context, PreProcessorContext
 
 
@@ -43,3 +46,12 @@ def test_preprocessor_context_initialization():
     assert context.payload == payload
     assert context.credentials == credentials
     assert context.project == project
+
+
+@pytest.mark.parametrize("instance", [
+    Context(credentials={}, parameters={}, globals={}, contact={}, project={}, constants={}),
+    PreProcessorContext(params={}, payload={}, credentials={}, project={}),
+], ids=lambda instance: type(instance).__name__)
+def test_context_uses_slots(instance):
+    """Test that context instances don't carry a per-instance __dict__"""
+    assert not hasattr(instance, "__dict__")
@@ -6,7 +6,7 @@ so toolkit integrations don't need to hand-roll URL building, configuration
 resolution, authentication headers, and error translation.
 """
 
-from weni.flows.client import FlowsClient
+from weni.flows.client import FlowsClient, get_session
 from weni.flows.exceptions import (
 	FlowsClientConfigError,
 	FlowsClientError,
@@ -22,4 +22,5 @@ __all__ = [
 	'FlowsHTTPError',
 	'FlowsNetworkError',
 	'FlowsResponseError',
+	'get_session',
 ]
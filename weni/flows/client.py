@@ -6,10 +6,14 @@ authenticated requests to arbitrary Flows paths, and translates failures
 into the typed error hierarchy from :mod:`weni.flows.exceptions`.
 """
 
+import http.cookiejar
 import os
+import threading
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from weni.context import Context
 from weni.flows.exceptions import (
@@ -21,6 +25,54 @@ from weni.flows.exceptions import (
 
 JSONResponse = dict[str, Any] | list[Any] | None
 
+# HTTP session shared by every Flows client and broadcast sender in the
+# process, so consecutive requests to Flows (including across tool executions,
+# e.g. warm Lambda starts) reuse pooled keep-alive connections instead of
+# re-doing the TCP/TLS handshake. Its cookie jar rejects every cookie, so
+# nothing set by one project's response is sent with another project's requests.
+_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+
+# Connection errors are retried, since the request never reached Flows. Read
+# errors, other errors (e.g. SSL failures after the body was sent), redirects
+# and error responses are not, so a request is never sent twice.
+_CONNECT_RETRIES = 3
+
+# Keep-alive connections kept per host. The default of 10 is too small once
+# the 8 background broadcast workers, sync broadcast sends and FlowsClient
+# calls from the host's own threads share the session; connections returned
+# to a full pool are closed instead of reused.
+_POOL_MAXSIZE = 32
+
+
+def get_session() -> requests.Session:
+	"""
+	Return the process-wide HTTP session used for Flows requests.
+
+	The session is created on first use. It retries connection errors only and
+	never stores cookies. Timeouts are left to each request.
+	"""
+	global _SESSION
+	if _SESSION is None:
+		with _SESSION_LOCK:
+			if _SESSION is None:
+				session = requests.Session()
+				session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+				retries = Retry(
+					total=_CONNECT_RETRIES,
+					connect=_CONNECT_RETRIES,
+					read=0,
+					status=0,
+					other=0,
+					redirect=0,
+					backoff_factor=0.1,
+				)
+				adapter = HTTPAdapter(pool_maxsize=_POOL_MAXSIZE, max_retries=retries)
+				session.mount('https://', adapter)
+				session.mount('http://', adapter)
+				_SESSION = session
+	return _SESSION
+
 
 class FlowsClient:
 	"""
@@ -33,6 +85,8 @@ class FlowsClient:
 
 	Args:
 		context: The execution context of the current tool.
+		timeout: Optional requests timeout in seconds, either a single value or
+			a (connect, read) tuple. None waits indefinitely.
 
 	Raises:
 		FlowsClientConfigError: If the auth token cannot be resolved.
@@ -40,8 +94,9 @@ class FlowsClient:
 
 	DEFAULT_FLOWS_URL = 'https://flows.stg.cloud.weni.ai'
 
-	def __init__(self, context: Context):
+	def __init__(self, context: Context, timeout: float | tuple[float, float] | None = None):
 		self.context = context
+		self.timeout = timeout
 
 		base_url = self._resolve_config('flows_url', 'FLOWS_BASE_URL') or self.DEFAULT_FLOWS_URL
 		self.base_url = base_url.rstrip('/')
@@ -123,7 +178,7 @@ class FlowsClient:
 			FlowsNetworkError: If the request fails before a response is received.
 		"""
 		try:
-			return requests.request(method, url, headers=headers, json=json, params=params)
+			return get_session().request(method, url, headers=headers, json=json, params=params, timeout=self.timeout)
 		except requests.exceptions.RequestException as e:
 			raise FlowsNetworkError(f'Failed to request Flows: {e}') from e
 
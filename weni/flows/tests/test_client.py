@@ -5,11 +5,15 @@ Covers verb delegation, URL building, header construction, payload
 forwarding, and response parsing — all with the network layer mocked.
 """
 
+import http.client
 from unittest.mock import MagicMock
 
 import pytest
+import requests
+from requests.cookies import MockRequest, MockResponse
+from urllib3.exceptions import MaxRetryError, SSLError
 
-from weni.flows import FlowsClient
+from weni.flows import FlowsClient, get_session
 
 BASE_URL = 'https://flows.example.com'
 PROJECT = {'flows_url': BASE_URL, 'auth_token': 'test-token'}
@@ -29,7 +33,7 @@ def make_response(status_code: int = 200, content: bytes = b'{}', json_value: ob
 @pytest.fixture
 def mock_request(mocker):
 	"""Patch the transport call used by the client."""
-	mock = mocker.patch('weni.flows.client.requests.request')
+	mock = mocker.patch('weni.flows.client.requests.Session.request')
 	mock.return_value = make_response(json_value={'ok': True})
 	return mock
 
@@ -46,6 +50,7 @@ class TestVerbs:
 			headers=EXPECTED_HEADERS,
 			json=None,
 			params=None,
+			timeout=None,
 		)
 
 	def test_post(self, make_context, mock_request):
@@ -59,6 +64,7 @@ class TestVerbs:
 			headers=EXPECTED_HEADERS,
 			json={'k': 'v'},
 			params=None,
+			timeout=None,
 		)
 
 	def test_put(self, make_context, mock_request):
@@ -139,3 +145,51 @@ class TestResponseParsing:
 
 		assert client.delete('/api/test') is None
 		mock_request.return_value.json.assert_not_called()
+
+
+class TestSession:
+	def test_session_created_once(self, mocker):
+		mocker.patch('weni.flows.client._SESSION', None)
+		session = get_session()
+
+		assert isinstance(session, requests.Session)
+		assert get_session() is session
+
+	def test_session_retries_connection_errors_only(self, mocker):
+		mocker.patch('weni.flows.client._SESSION', None)
+		retries = get_session().get_adapter(BASE_URL).max_retries
+
+		assert retries.connect == 3
+		assert retries.read == 0
+		assert retries.status == 0
+		assert retries.other == 0
+		assert retries.redirect == 0
+		with pytest.raises(MaxRetryError):
+			retries.increment('POST', '/api/test', error=SSLError('EOF occurred'))
+
+	def test_session_does_not_store_cookies(self, mocker):
+		mocker.patch('weni.flows.client._SESSION', None)
+		session = get_session()
+		headers = http.client.HTTPMessage()
+		headers['Set-Cookie'] = 'sessionid=abc; Path=/'
+		request = requests.Request('GET', f'{BASE_URL}/api/test').prepare()
+		session.cookies.extract_cookies(MockResponse(headers), MockRequest(request))
+
+		assert len(session.cookies) == 0
+
+	def test_timeout_is_forwarded(self, make_context, mock_request):
+		FlowsClient(make_context(project=PROJECT), timeout=(1.0, 30.0)).get('/api/a')
+
+		assert mock_request.call_args.kwargs['timeout'] == (1.0, 30.0)
+
+	def test_requests_go_through_shared_session(self, make_context, mocker):
+		mocker.patch('weni.flows.client._SESSION', None)
+		mock_request = mocker.patch('weni.flows.client.requests.Session.request', autospec=True)
+		mock_request.return_value = make_response(json_value={'ok': True})
+
+		FlowsClient(make_context(project=PROJECT)).get('/api/a')
+		FlowsClient(make_context(project={**PROJECT, 'auth_token': 'other'})).get('/api/b')
+
+		sessions = [call.args[0] for call in mock_request.call_args_list]
+		assert len(sessions) == 2
+		assert sessions[0] is sessions[1] is get_session()
@@ -95,7 +95,7 @@ class TestAuthTokenValidation:
 		assert 'context.project' in str(exc_info.value)
 
 	def test_missing_token_never_sends_request(self, make_context, mocker):
-		mock_request = mocker.patch('weni.flows.client.requests.request')
+		mock_request = mocker.patch('weni.flows.client.requests.Session.request')
 
 		with pytest.raises(FlowsClientConfigError):
 			FlowsClient(make_context())
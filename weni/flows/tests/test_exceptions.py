@@ -33,7 +33,7 @@ def make_error_response(status_code: int, text: str) -> MagicMock:
 
 class TestHTTPErrorTranslation:
 	def test_non_2xx_raises_flows_http_error(self, make_context, mocker):
-		mock_request = mocker.patch('weni.flows.client.requests.request')
+		mock_request = mocker.patch('weni.flows.client.requests.Session.request')
 		mock_request.return_value = make_error_response(400, '{"detail": "Invalid"}')
 		client = FlowsClient(make_context(project=PROJECT))
 
@@ -45,7 +45,7 @@ class TestHTTPErrorTranslation:
 		assert '400' in str(exc_info.value)
 
 	def test_original_exception_chained(self, make_context, mocker):
-		mock_request = mocker.patch('weni.flows.client.requests.request')
+		mock_request = mocker.patch('weni.flows.client.requests.Session.request')
 		mock_request.return_value = make_error_response(500, 'Server error')
 		client = FlowsClient(make_context(project=PROJECT))
 
@@ -57,7 +57,7 @@ class TestHTTPErrorTranslation:
 
 class TestNetworkErrorTranslation:
 	def test_transport_failure_raises_flows_network_error(self, make_context, mocker):
-		mock_request = mocker.patch('weni.flows.client.requests.request')
+		mock_request = mocker.patch('weni.flows.client.requests.Session.request')
 		mock_request.side_effect = requests.exceptions.ConnectionError('Connection refused')
 		client = FlowsClient(make_context(project=PROJECT))
 
@@ -75,7 +75,7 @@ class TestResponseErrorTranslation:
 		response.content = b'not json'
 		response.raise_for_status.return_value = None
 		response.json.side_effect = ValueError('No JSON object could be decoded')
-		mocker.patch('weni.flows.client.requests.request', return_value=response)
+		mocker.patch('weni.flows.client.requests.Session.request', return_value=response)
 		client = FlowsClient(make_context(project=PROJECT))
 
 		with pytest.raises(FlowsResponseError) as exc_info:
@@ -97,7 +97,7 @@ class TestErrorHierarchy:
 			FlowsClient(make_context())
 
 	def test_base_type_catches_http_error(self, make_context, mocker):
-		mock_request = mocker.patch('weni.flows.client.requests.request')
+		mock_request = mocker.patch('weni.flows.client.requests.Session.request')
 		mock_request.return_value = make_error_response(404, 'Not found')
 		client = FlowsClient(make_context(project=PROJECT))
 
@@ -105,7 +105,7 @@ class TestErrorHierarchy:
 			client.get('/api/test')
 
 	def test_base_type_catches_network_error(self, make_context, mocker):
-		mocker.patch('weni.flows.client.requests.request', side_effect=requests.exceptions.Timeout('timed out'))
+		mocker.patch('weni.flows.client.requests.Session.request', side_effect=requests.exceptions.Timeout('timed out'))
 		client = FlowsClient(make_context(project=PROJECT))
 
 		with pytest.raises(FlowsClientError):
@@ -45,14 +45,17 @@ class Response:
     def __new__(cls, data: Any, components: list[Type[Component]]) -> ResponseObject:  # type: ignore
         instance = super().__new__(cls)
         instance._data = deepcopy(data)
-        instance._components = deepcopy(components)
+        # Component classes are copied by reference by deepcopy anyway, so a
+        # shallow copy of the list is equivalent and skips the deepcopy walk
+        instance._components = list(components)
 
         validate_components(instance._components)
 
-        final_format: dict[str, Any] = {"msg": {}}
-
+        msg: dict[str, Any] = {}
         for component in instance._components:
-            final_format["msg"] = {**final_format["msg"], **component.get_format_example()}
+            msg.update(component.get_format_example())
+
+        final_format: dict[str, Any] = {"msg": msg}
 
         return instance._data, final_format
 
@@ -1,4 +1,5 @@
-from typing import Any
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any
 
 from weni.broadcasts.broadcast import Broadcast
 from weni.broadcasts.messages import Message
@@ -6,6 +7,9 @@ from weni.context import Context
 from weni.events.event import Event
 from weni.responses import ResponseObject, TextResponse
 
+if TYPE_CHECKING:
+    from weni.broadcasts.sender import BroadcastSender
+
 
 class Tool:
     """
@@ -43,17 +47,22 @@ class Tool:
 
     _pending_broadcasts: list[dict[str, Any]]
     _pending_events: list[Event]
+    _broadcast_sender: "BroadcastSender | None"
+    _pending_broadcast_futures: list[Future]
     context: Context
 
     def __new__(cls, context: Context):
         instance = super().__new__(cls)
         instance._pending_broadcasts = []
         instance._pending_events = []
+        instance._broadcast_sender = None
+        instance._pending_broadcast_futures = []
         instance.context = context
 
         Event.registry = []
 
         execute_result = instance.execute(context)
+        Broadcast(instance).wait(raise_errors=False)
 
         legacy_events = [event.to_dict() for event in Event.registry]
         new_events = [event.to_dict() for event in instance._pending_events]
@@ -20,6 +20,17 @@ def test_validate_third_party_component():
     assert "is not an official component" in str(exc.value)
 
 
+def test_validate_third_party_component_with_official_name():
+    """Test that a third-party component reusing an official name raises ValueError"""
+
+    class Text(Component):
+        pass
+
+    with pytest.raises(ValueError) as exc:
+        validate_components([Text])
+    assert "is not an official component" in str(exc.value)
+
+
 def test_validate_modified_string_attribute():
     """Test that modifying a string attribute (even with another string) raises ValueError"""
     original_format = Text._format_example.copy()
@@ -7,6 +7,14 @@ from weni.components import Component
 # Store original component values when module is loaded
 _original_components: dict[str, dict[str, Any]] = {}
 
+# String forms of the original values, which is what validation compares against
+_original_strings: dict[str, dict[str, str]] = {}
+
+# Official components and the attributes to validate, resolved once when the
+# module is loaded alongside the original values they are checked against
+_official_components: dict[str, Type[Component]] = {}
+_component_attributes: set[str] = set()
+
 
 def _store_original_values() -> None:
     """
@@ -15,19 +23,13 @@ def _store_original_values() -> None:
     Creates immutable snapshots of all official component attributes to use
     for validation. This prevents component modification after module load.
     """
-    # Get non-private, non-callable attributes from Component class
-    component_attrs = {
-        name for name, value in vars(Component).items() if not name.startswith("__") and not callable(value)
-    }
-
-    # Get all Component subclasses from the component module
-    component_module = inspect.getmodule(Component)
-    component_classes = inspect.getmembers(component_module, inspect.isclass)
+    _component_attributes.update(_get_component_attributes())
+    _official_components.update(_get_official_components())
 
     # Store deep copies of attributes for each valid component
-    for name, cls in component_classes:
-        if issubclass(cls, Component) and cls is not Component:
-            _original_components[name] = {attr: deepcopy(getattr(cls, attr)) for attr in component_attrs}
+    for name, cls in _official_components.items():
+        _original_components[name] = {attr: deepcopy(getattr(cls, attr)) for attr in _component_attributes}
+        _original_strings[name] = {attr: str(value) for attr, value in _original_components[name].items()}
 
 
 def validate_components(components: list[Type[Component]]) -> bool:
@@ -54,12 +56,9 @@ def validate_components(components: list[Type[Component]]) -> bool:
             print(f"Validation failed: {e}")
         ```
     """
-    component_attrs = _get_component_attributes()
-    official_components = _get_official_components()
-
     for component in components:
-        _validate_component_is_official(component, official_components)
-        _validate_component_attributes(component, component_attrs)
+        _validate_component_is_official(component, _official_components)
+        _validate_component_attributes(component, _component_attributes)
 
     return True
 
@@ -96,7 +95,7 @@ def _validate_component_is_official(
     Raises:
         ValueError: If component is not in the official components list
     """
-    if component not in official_components.values():
+    if official_components.get(component.__name__) is not component:
         raise ValueError(
             f"Component {component.__name__} is not an official component. "
             f"Only components defined in {Component.__module__} are allowed."
@@ -105,13 +104,13 @@ def _validate_component_is_official(
 
 def _validate_component_attributes(component: Type[Component], component_attrs: set[str]) -> None:
     """Validate that component attributes haven't been modified"""
-    original_values = _original_components[component.__name__]
+    original_strings = _original_strings[component.__name__]
 
     for attr_name in component_attrs:
         current_value = getattr(component, attr_name)
-        original_value = original_values[attr_name]
 
-        if str(original_value) != str(current_value):
+        if original_strings[attr_name] != str(current_value):
+            original_value = _original_components[component.__name__][attr_name]
             raise ValueError(
                 f"{component.__name__}.{attr_name} has been modified. "
                 f"Original value: {original_value!r}, Current value: {current_value!r}"